@@ -1,21 +1,110 @@
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
 def count_zeros_during_rotation(start, direction, distance):
     """Count how many times the dial points at 0 during a rotation"""
-    zero_count = 0
-    
     if direction == 'L':
-        # Moving left (decreasing)
-        for i in range(1, distance + 1):
-            position = (start - i) % 100
-            if position == 0:
-                zero_count += 1
+        # Moving left (decreasing): first zero after (start or 100) clicks,
+        # then one more every full turn
+        return ((100 - start) % 100 + distance) // 100
     else:  # direction == 'R'
-        # Moving right (increasing)
-        for i in range(1, distance + 1):
-            position = (start + i) % 100
-            if position == 0:
-                zero_count += 1
+        # Moving right (increasing): one zero per multiple of 100 passed
+        return (start + distance) // 100
+
+def read_rotations(f):
+    """Yield rotations one line at a time so huge logs stay out of memory"""
+    for line in f:
+        rotation = line.strip()
+        if rotation:
+            yield rotation
+
+def read_rotation_chunk(filename, start, end):
+    """Yield the rotations whose line begins inside the byte range [start, end)"""
+    with open(filename, 'rb') as f:
+        if start > 0:
+            # Skip the line that straddles the boundary; the previous chunk owns it
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            rotation = line.strip().decode()
+            if rotation:
+                yield rotation
+
+def summarize_rotations(rotations):
+    """
+    Summarize a run of rotations independently of where the dial starts.
+    Returns (net_offset, zeros_by_start) where zeros_by_start[s] is the
+    number of zero hits when the run begins at position s.
+    """
+    net_offset = 0
+    # Difference array over start positions
+    diff = [0] * 101
+    base = 0
     
-    return zero_count
+    def add_starts(first, length):
+        # Add one to `length` consecutive start positions, wrapping at 100
+        begin = (first - net_offset) % 100
+        stop = begin + length
+        diff[begin] += 1
+        if stop <= 100:
+            diff[stop] -= 1
+        else:
+            diff[100] -= 1
+            diff[0] += 1
+            diff[stop - 100] -= 1
+    
+    for rotation in rotations:
+        direction = rotation[0]
+        distance = int(rotation[1:])
+        full_turns, remainder = divmod(distance, 100)
+        
+        # Every full turn passes 0 once whatever the position
+        base += full_turns
+        # The partial turn passes 0 only from some positions
+        if remainder:
+            if direction == 'L':
+                add_starts(1, remainder)
+            else:  # direction == 'R'
+                add_starts(100 - remainder, remainder)
+        
+        if direction == 'L':
+            net_offset -= distance
+        else:  # direction == 'R'
+            net_offset += distance
+    
+    zeros_by_start = []
+    running = base
+    for start in range(100):
+        running += diff[start]
+        zeros_by_start.append(running)
+    
+    return net_offset % 100, zeros_by_start
+
+def summarize_chunk(filename, start, end):
+    return summarize_rotations(read_rotation_chunk(filename, start, end))
+
+def solve_dial_puzzle_part2_parallel(filename, workers=None):
+    """Summarize byte ranges of the log in a process pool, then combine them in order"""
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(filename)
+    bounds = [size * i // workers for i in range(workers + 1)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = pool.map(summarize_chunk, [filename] * workers, bounds[:-1], bounds[1:])
+        
+        position = 50
+        total_zero_count = 0
+        for net_offset, zeros_by_start in summaries:
+            total_zero_count += zeros_by_start[position]
+            position = (position + net_offset) % 100
+    
+    return total_zero_count
 
 def solve_dial_puzzle_part2(rotations):
     position = 50
@@ -37,9 +126,75 @@ def solve_dial_puzzle_part2(rotations):
     
     return total_zero_count
 
-# Read your puzzle input
-with open('solution.csv', 'r') as f:
-    rotations = [line.strip() for line in f.readlines()]
+def build_zero_index(rotations, index_filename):
+    """
+    Write the running zero count after every rotation to index_filename.
+    The file is a flat array of native unsigned 64-bit integers, entry k
+    holding the zeros seen during the first k rotations (entry 0 is 0).
+    """
+    position = 50
+    total_zero_count = 0
+    block = array('Q', [0])
+    
+    with open(index_filename, 'wb') as out:
+        for rotation in rotations:
+            direction = rotation[0]
+            distance = int(rotation[1:])
+            
+            total_zero_count += count_zeros_during_rotation(position, direction, distance)
+            block.append(total_zero_count)
+            
+            if direction == 'L':
+                position = (position - distance) % 100
+            else:  # direction == 'R'
+                position = (position + distance) % 100
+            
+            # Flush periodically so memory stays bounded on huge logs
+            if len(block) >= 65536:
+                block.tofile(out)
+                del block[:]
+        block.tofile(out)
+
+class ZeroIndex:
+    """Memory-mapped view over a file written by build_zero_index"""
+    def __init__(self, index_filename):
+        self._file = open(index_filename, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.prefix = memoryview(self._map).cast('Q')
+    
+    def __len__(self):
+        """Number of rotations covered by the index"""
+        return len(self.prefix) - 1
+    
+    def zeros_between(self, i, j):
+        """Zeros hit during rotations i..j-1 (0-based, j exclusive)"""
+        if not 0 <= i <= j <= len(self):
+            raise IndexError(f"Rotation range {i}..{j} is outside 0..{len(self)}")
+        return self.prefix[j] - self.prefix[i]
+    
+    def nth_zero(self, n):
+        """0-based rotation during which the nth zero (1-based) was hit, or None"""
+        if n < 1 or n > self.prefix[-1]:
+            return None
+        return bisect_left(self.prefix, n) - 1
+    
+    def close(self):
+        self.prefix.release()
+        self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
 
-password = solve_dial_puzzle_part2(rotations)
-print(f"The password is: {password}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Read your puzzle input
+    with open('solution.csv', 'r') as f:
+        password = solve_dial_puzzle_part2(read_rotations(f))
+    
+    # For multi-gigabyte logs, spread the work across all cores instead
+    # password = solve_dial_puzzle_part2_parallel('solution.csv')
+    
+    print(f"The password is: {password}")
@@ -1,3 +1,6 @@
+from collections import Counter
+from itertools import accumulate
+
 def solve_dial_puzzle(rotations):
     position = 50
     zero_count = 0
@@ -16,9 +19,29 @@ def solve_dial_puzzle(rotations):
     
     return zero_count
 
+def solve_dial_sweep(rotations, dial_sizes=(100,)):
+    """
+    Evaluate one rotation log for every start position of every dial size.
+    Returns {dial_size: [zero_count for start in range(dial_size)]}
+    """
+    # Signed distances and their running totals, computed once for all dials
+    offsets = list(accumulate(
+        -int(rotation[1:]) if rotation[0] == 'L' else int(rotation[1:])
+        for rotation in rotations
+    ))
+    
+    results = {}
+    for dial_size in dial_sizes:
+        # The dial lands on 0 after rotation i exactly when
+        # start + offsets[i] is a multiple of dial_size
+        residues = Counter(offset % dial_size for offset in offsets)
+        results[dial_size] = [residues[-start % dial_size] for start in range(dial_size)]
+    
+    return results
+
 # Read your puzzle input
 with open('solution.csv', 'r') as f:
     rotations = [line.strip() for line in f.readlines()]
 
 password = solve_dial_puzzle(rotations)
-print(f"The password is: {password}")
\ No newline at end of file
+print(f"The password is: {password}")
@@ -0,0 +1,133 @@
+"""
+Advent of Code 2025 - Day 2
+Digit DP engine for counting and summing IDs that match a digit policy
+"""
+
+class KFoldRepetition:
+    """IDs made of one seed repeated exactly k times (part 1 is k = 2)"""
+    def __init__(self, k):
+        self.k = k
+
+    def count_and_sum_upto(self, length, limit):
+        if length % self.k != 0:
+            return 0, 0
+        return repeated_seed_count_and_sum(length, length // self.k, limit)
+
+class RepeatedAtLeastTwice:
+    """IDs made of one seed repeated two or more times (part 2)"""
+    def count_and_sum_upto(self, length, limit):
+        primes = prime_factors(length)
+        count = total = 0
+
+        # Inclusion-exclusion: a repeated ID repeats with pattern length
+        # length / q for some prime q, intersections with length / (q1 * q2 ...)
+        for mask in range(1, 1 << len(primes)):
+            divisor = 1
+            chosen = 0
+            for bit, q in enumerate(primes):
+                if mask >> bit & 1:
+                    divisor *= q
+                    chosen += 1
+
+            c, s = repeated_seed_count_and_sum(length, length // divisor, limit)
+            if chosen % 2 == 1:
+                count, total = count + c, total + s
+            else:
+                count, total = count - c, total - s
+
+        return count, total
+
+class DigitAutomaton:
+    """
+    User-supplied policy: read the digits left to right through a state machine.
+    step(state, digit) returns the next state, or None to reject the ID.
+    accepts(state) decides whether a fully read ID matches.
+    States must be hashable; runtime is O(digits * states * 10).
+
+    Example - IDs whose digits never decrease:
+        DigitAutomaton(0, lambda last, d: d if d >= last else None, lambda last: True)
+    """
+    def __init__(self, start, step, accepts):
+        self.start = start
+        self.step = step
+        self.accepts = accepts
+
+    def count_and_sum_upto(self, length, limit):
+        digits = [int(c) for c in str(limit)]
+
+        # Paths still equal to limit's prefix, and paths already below it:
+        # state -> (count, sum of the prefixes read so far)
+        tight = self.start
+        below = {}
+
+        for pos, limit_digit in enumerate(digits):
+            lowest = 1 if pos == 0 else 0
+            next_below = {}
+
+            def add(state, count, total):
+                if state is None:
+                    return
+                c, s = next_below.get(state, (0, 0))
+                next_below[state] = (c + count, s + total)
+
+            for state, (count, total) in below.items():
+                for digit in range(lowest, 10):
+                    add(self.step(state, digit), count, total * 10 + digit * count)
+
+            if tight is not None:
+                prefix = limit // 10 ** (length - pos)
+                for digit in range(lowest, limit_digit):
+                    add(self.step(tight, digit), 1, prefix * 10 + digit)
+                tight = self.step(tight, limit_digit)
+
+            below = next_below
+
+        count = total = 0
+        for state, (c, s) in below.items():
+            if self.accepts(state):
+                count, total = count + c, total + s
+        if tight is not None and self.accepts(tight):
+            count, total = count + 1, total + limit
+
+        return count, total
+
+def prime_factors(n):
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+def repeated_seed_count_and_sum(length, pattern_length, limit):
+    """Count and sum length-digit IDs <= limit that repeat a pattern_length seed"""
+    multiplier = (10 ** length - 1) // (10 ** pattern_length - 1)
+    lowest = 10 ** (pattern_length - 1)
+    highest = min(10 ** pattern_length - 1, limit // multiplier)
+    if lowest > highest:
+        return 0, 0
+
+    count = highest - lowest + 1
+    return count, multiplier * (lowest + highest) * count // 2
+
+def count_and_sum(policy, start, end):
+    """Count and sum the IDs in [start, end] that satisfy policy"""
+    count = total = 0
+
+    for length in range(len(str(start)), len(str(end)) + 1):
+        smallest = 10 ** (length - 1)
+        largest = 10 ** length - 1
+
+        c, s = policy.count_and_sum_upto(length, min(end, largest))
+        if start > smallest:
+            c_below, s_below = policy.count_and_sum_upto(length, start - 1)
+            c, s = c - c_below, s - s_below
+
+        count, total = count + c, total + s
+
+    return count, total
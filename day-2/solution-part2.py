@@ -1,3 +1,12 @@
+import heapq
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice
+
+from digit_dp import RepeatedAtLeastTwice, count_and_sum, prime_factors
+
 def is_invalid_id_part2(num):
     """Check if a number is invalid (pattern repeated at least twice)"""
     s = str(num)
@@ -17,6 +26,80 @@ def is_invalid_id_part2(num):
     
     return False
 
+def repunit(length, pattern_length):
+    """Multiplier that repeats a pattern_length seed to fill length digits"""
+    return (10 ** length - 1) // (10 ** pattern_length - 1)
+
+@lru_cache(maxsize=None)
+def repeat_multipliers(length):
+    """
+    Multipliers for the longest pattern lengths length / q (q prime).
+    Any repeated ID of this length is a multiple of at least one of them.
+    """
+    return tuple(repunit(length, length // q) for q in prime_factors(length))
+
+def classify_ids(id_strings):
+    """
+    Part 2 check for a batch of decimal ID strings, using divisibility only.
+    Blank strings are never invalid; leading zeros do not count as digits.
+    """
+    return [
+        any(num % m == 0 for m in repeat_multipliers(len(s.lstrip('0'))))
+        for s, num in zip(id_strings, (int(s) if s else 0 for s in id_strings))
+    ]
+
+def classify_id_stream(infile, outfile, mode='filter', chunk_size=65536):
+    """
+    Classify one ID per line from infile in chunks of chunk_size lines.
+    mode 'filter' writes only the invalid IDs, mode 'mask' writes 1/0 per
+    input line (0 for blank lines) so the mask lines up with the input.
+    Returns the number of invalid IDs seen.
+    """
+    invalid_count = 0
+    
+    while True:
+        chunk = [line.strip() for line in islice(infile, chunk_size)]
+        if not chunk:
+            break
+        mask = classify_ids(chunk)
+        invalid_count += sum(mask)
+        
+        if mode == 'mask':
+            outfile.write(''.join('1\n' if bad else '0\n' for bad in mask))
+        else:
+            outfile.write(''.join(s + '\n' for s, bad in zip(chunk, mask) if bad))
+    
+    return invalid_count
+
+def seed_bounds(start, end, length, pattern_length):
+    """Range of seeds whose repetition to length digits lands in [start, end]"""
+    multiplier = repunit(length, pattern_length)
+    lowest = max(10 ** (pattern_length - 1), -(-start // multiplier))
+    highest = min(10 ** pattern_length - 1, end // multiplier)
+    return lowest, highest, multiplier
+
+def repeated_family(start, end, length, pattern_length):
+    """
+    Invalid IDs in [start, end] of one length whose shortest seed has
+    pattern_length digits, in increasing order
+    """
+    lowest, highest, multiplier = seed_bounds(start, end, length, pattern_length)
+    for seed in range(lowest, highest + 1):
+        # A seed that is itself repeated was already produced by a shorter one
+        if not is_invalid_id_part2(seed):
+            yield seed * multiplier
+
+def invalid_ids_in_range_part2(start, end):
+    """Generate each invalid ID in [start, end] once, from its shortest seed"""
+    for length in range(len(str(start)), len(str(end)) + 1):
+        for pattern_length in range(1, length // 2 + 1):
+            if length % pattern_length == 0:
+                yield from repeated_family(start, end, length, pattern_length)
+
+def sum_invalid_ids_part2(start, end):
+    """Sum the invalid IDs in [start, end] without enumerating them"""
+    return count_and_sum(RepeatedAtLeastTwice(), start, end)[1]
+
 def solve_gift_shop_part2(input_string):
     """Find sum of all invalid IDs in the given ranges (Part 2)"""
     # Parse the input
@@ -32,10 +115,100 @@ def solve_gift_shop_part2(input_string):
         # Parse the range
         start, end = map(int, range_str.split('-'))
         
-        # Check each ID in the range
-        for num in range(start, end + 1):
-            if is_invalid_id_part2(num):
-                total_sum += num
+        # Sum the invalid IDs directly instead of testing every ID
+        total_sum += sum_invalid_ids_part2(start, end)
+    
+    return total_sum
+
+def build_invalid_id_table(table_filename, max_digits):
+    """
+    Write every invalid ID with at most max_digits digits, in sorted order,
+    together with running sums, as native unsigned 64-bit records:
+        header:  (max_digits, count, 0)
+        records: (id, running_sum_low, running_sum_high)
+    Running sums are split into two words because they outgrow 64 bits.
+    """
+    if max_digits > 19:
+        raise ValueError("IDs must fit in 64 bits (max_digits <= 19)")
+    
+    count = 0
+    running_sum = 0
+    
+    with open(table_filename, 'wb') as out:
+        array('Q', [max_digits, 0, 0]).tofile(out)
+        
+        block = array('Q')
+        for length in range(1, max_digits + 1):
+            # Each pattern length yields its IDs in increasing order, so
+            # merging the families streams the whole length in sorted order
+            families = [
+                repeated_family(10 ** (length - 1), 10 ** length - 1, length, pattern_length)
+                for pattern_length in range(1, length // 2 + 1)
+                if length % pattern_length == 0
+            ]
+            for num in heapq.merge(*families):
+                running_sum += num
+                count += 1
+                block.extend((num, running_sum & 0xFFFFFFFFFFFFFFFF, running_sum >> 64))
+                # Flush periodically so memory stays bounded
+                if len(block) >= 3 * 65536:
+                    block.tofile(out)
+                    del block[:]
+        block.tofile(out)
+        
+        out.seek(0)
+        array('Q', [max_digits, count, 0]).tofile(out)
+
+class InvalidIdTable:
+    """Memory-mapped view over a file written by build_invalid_id_table"""
+    def __init__(self, table_filename):
+        self._file = open(table_filename, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._words = memoryview(self._map).cast('Q')
+        self.max_digits = self._words[0]
+        records = self._words[3:]
+        self.ids = records[0::3]
+        self._sum_low = records[1::3]
+        self._sum_high = records[2::3]
+    
+    def running_sum(self, index):
+        """Sum of the first index invalid IDs"""
+        if index == 0:
+            return 0
+        return self._sum_high[index - 1] << 64 | self._sum_low[index - 1]
+    
+    def sum_range(self, start, end):
+        """Sum of invalid IDs in [start, end] using two binary searches"""
+        if end >= 10 ** self.max_digits:
+            raise ValueError(f"Range {start}-{end} exceeds the table's {self.max_digits} digits")
+        first = bisect_left(self.ids, start)
+        last = bisect_right(self.ids, end)
+        return self.running_sum(last) - self.running_sum(first)
+    
+    def close(self):
+        for view in (self.ids, self._sum_low, self._sum_high, self._words):
+            view.release()
+        self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+def solve_gift_shop_part2_with_table(input_string, table_filename):
+    """Same as solve_gift_shop_part2, answered from a prebuilt table"""
+    total_sum = 0
+    
+    with InvalidIdTable(table_filename) as table:
+        for range_str in input_string.strip().split(','):
+            range_str = range_str.strip()
+            if not range_str:
+                continue
+            
+            start, end = map(int, range_str.split('-'))
+            total_sum += table.sum_range(start, end)
     
     return total_sum
 
@@ -47,6 +220,10 @@ def solve_gift_shop_part2(input_string):
 # result = solve_gift_shop_part2(example_input)
 # print(f"Example result: {result}")
 
+# # Bulk ID stream (one ID per line), keeping only the invalid ones
+# import sys
+# classify_id_stream(sys.stdin, sys.stdout)
+
 # Actual puzzle input
 with open('solution.csv', 'r') as f:
     puzzle_input = f.read()
@@ -14,6 +14,21 @@ def is_invalid_id(num):
     
     return first_half == second_half
 
+def invalid_ids_in_range(start, end):
+    """Generate the invalid IDs in [start, end] from their repeated half"""
+    for length in range(len(str(start)), len(str(end)) + 1):
+        if length % 2 != 0:
+            continue
+        
+        # An ID made of a half repeated twice is half * (10^half_length + 1)
+        half_length = length // 2
+        multiplier = 10 ** half_length + 1
+        lowest = max(10 ** (half_length - 1), -(-start // multiplier))
+        highest = min(10 ** half_length - 1, end // multiplier)
+        
+        for half in range(lowest, highest + 1):
+            yield half * multiplier
+
 def solve_gift_shop(input_string):
     """Find sum of all invalid IDs in the given ranges"""
     # Parse the input
@@ -29,10 +44,8 @@ def solve_gift_shop(input_string):
         # Parse the range
         start, end = map(int, range_str.split('-'))
         
-        # Check each ID in the range
-        for num in range(start, end + 1):
-            if is_invalid_id(num):
-                total_sum += num
+        # Only visit the IDs that are invalid
+        total_sum += sum(invalid_ids_in_range(start, end))
     
     return total_sum
 
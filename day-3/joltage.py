@@ -0,0 +1,141 @@
+"""
+Advent of Code 2025 - Day 3
+Largest k-digit subsequence of a battery bank in linear time
+"""
+
+import mmap
+from array import array
+
+def select_batteries(bank, k):
+    """
+    Return the largest k-digit subsequence of bank as a string.
+    Monotonic stack: drop a smaller digit whenever a larger one arrives
+    and we can still afford to skip it. O(len(bank)) for any k.
+    """
+    to_skip = len(bank) - k
+    stack = []
+
+    for digit in bank:
+        while to_skip and stack and stack[-1] < digit:
+            stack.pop()
+            to_skip -= 1
+        stack.append(digit)
+
+    return ''.join(stack[:k])
+
+def max_joltage(bank, k):
+    """Maximum joltage from selecting exactly k batteries (0 if the bank is too short)"""
+    if len(bank) < k:
+        return 0
+    return int(select_batteries(bank, k))
+
+class JoltageIndex:
+    """
+    Sparse table over one bank for leftmost-maximum range queries.
+    Built once in O(n log n); each greedy step is then an O(1) query,
+    so the best joltage for many k values costs O(k) per k.
+    """
+    def __init__(self, bank):
+        self.bank = bank
+        n = len(bank)
+        self.n = n
+        # Encode (digit, leftmost position) so plain max() picks the right entry
+        level = [int(digit) * n + (n - 1 - pos) for pos, digit in enumerate(bank)]
+        self.table = [level]
+
+        width = 1
+        while 2 * width <= n:
+            level = list(map(max, level, level[width:]))
+            self.table.append(level)
+            width *= 2
+
+    def query(self, lo, hi):
+        """Leftmost position of the largest digit in bank[lo..hi]"""
+        j = (hi - lo + 1).bit_length() - 1
+        level = self.table[j]
+        key = max(level[lo], level[hi - (1 << j) + 1])
+        return self.n - 1 - key % self.n
+
+    def max_joltage(self, k):
+        if self.n < k:
+            return 0
+        digits = []
+        start = 0
+        for i in range(k):
+            pos = self.query(start, self.n - k + i)
+            digits.append(self.bank[pos])
+            start = pos + 1
+        return int(''.join(digits))
+
+    def all_joltages(self, ks=range(2, 65)):
+        """Map each k to the bank's best joltage"""
+        return {k: self.max_joltage(k) for k in ks}
+
+def solve_escalator_all_k(input_string, ks=range(2, 65)):
+    """Per-bank {k: joltage} maps and the per-k totals over all banks"""
+    per_bank = []
+    totals = dict.fromkeys(ks, 0)
+
+    for bank in input_string.strip().split('\n'):
+        bank = bank.strip()
+        if bank:
+            joltages = JoltageIndex(bank).all_joltages(ks)
+            per_bank.append(joltages)
+            for k, joltage in joltages.items():
+                totals[k] += joltage
+
+    return per_bank, totals
+
+# Single-byte search patterns, largest digit first
+DIGIT_NEEDLES = [(d, str(d).encode()) for d in range(9, -1, -1)]
+
+def solve_escalator_batched(filename, k, per_bank=False):
+    """
+    Total joltage for a file of equal-width banks, read through mmap.
+    Each greedy step searches the row window for '9', then '8', ... so the
+    scanning happens inside mmap.find rather than per digit in Python.
+    Returns the total, or (total, per-bank array) when per_bank is set.
+    """
+    total = 0
+    joltages = array('Q') if k <= 19 else []
+
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line_end = mm.find(b'\n')
+        if line_end == -1:
+            line_end = len(mm)
+        stride = line_end + 1
+        # Banks end before the line break, including a CRLF's '\r'
+        width = line_end - 1 if line_end > 0 and mm[line_end - 1] == ord('\r') else line_end
+        line_break = mm[width:stride]
+        # Trailing blank lines are not banks
+        data_end = len(mm)
+        while data_end > 0 and mm[data_end - 1] in b'\r\n':
+            data_end -= 1
+        num_banks = (data_end + stride - 1) // stride
+
+        for row in range(num_banks):
+            start = row * stride
+            end = start + width
+            # Every bank must be exactly width long, or windows would run into the next one
+            if end != data_end and mm[end:end + len(line_break)] != line_break:
+                raise ValueError(f"Bank {row + 1} is not {width} batteries long")
+            value = 0
+            # Too short to select k batteries, same as max_joltage
+            for i in range(k if k <= width else 0):
+                # Last position this digit may come from, leaving room for the rest
+                last = end - k + i
+                for digit, needle in DIGIT_NEEDLES:
+                    pos = mm.find(needle, start, last + 1)
+                    if pos != -1:
+                        break
+                else:
+                    raise ValueError(f"Bank {row + 1} contains a non-digit battery")
+                value = value * 10 + digit
+                start = pos + 1
+            total += value
+            if per_bank:
+                joltages.append(value)
+
+    if per_bank:
+        return total, joltages
+    return total
@@ -2,18 +2,11 @@
 Advent of Code 2025 - Day 3
 """
 
+from joltage import max_joltage
+
 def find_max_joltage(bank):
     """Find the maximum joltage from a bank by selecting two batteries"""
-    max_joltage = 0
-    
-    # Try all pairs of positions (i, j) where i < j
-    for i in range(len(bank)):
-        for j in range(i + 1, len(bank)):
-            # Form the two-digit number using batteries at positions i and j
-            joltage = int(bank[i] + bank[j])
-            max_joltage = max(max_joltage, joltage)
-    
-    return max_joltage
+    return max_joltage(bank, 2)
 
 def solve_escalator(input_string):
     """Find the total output joltage from all banks"""
@@ -23,9 +16,9 @@ def solve_escalator(input_string):
     for bank in banks:
         bank = bank.strip()
         if bank:
-            max_joltage = find_max_joltage(bank)
-            total_joltage += max_joltage
-            print(f"Bank {bank}: max joltage = {max_joltage}")
+            joltage = find_max_joltage(bank)
+            total_joltage += joltage
+            print(f"Bank {bank}: max joltage = {joltage}")
     
     return total_joltage
 
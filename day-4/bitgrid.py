@@ -0,0 +1,128 @@
+"""
+Advent of Code 2025 - Day 4
+Bit-packed roll grid: one Python int per row, one bit per cell
+"""
+
+TO_BITS = str.maketrans('@.', '10')
+
+def add_bit(counter, x):
+    """Add the 1-bit inputs in x to every column of a 4-bit bit-sliced counter"""
+    b0, b1, b2, b3 = counter
+    carry = b0 & x
+    b0 ^= x
+    carry, b1 = b1 & carry, b1 ^ carry
+    carry, b2 = b2 & carry, b2 ^ carry
+    b3 |= carry
+    return b0, b1, b2, b3
+
+def neighbour_counter(above, row, below, mask):
+    """Bit-sliced neighbour counts (b0, b1, b2, b3) for every cell of row"""
+    counter = (0, 0, 0, 0)
+    for line in (above, below):
+        counter = add_bit(counter, line)
+        counter = add_bit(counter, (line << 1) & mask)
+        counter = add_bit(counter, line >> 1)
+    counter = add_bit(counter, (row << 1) & mask)
+    counter = add_bit(counter, row >> 1)
+    return counter
+
+def accessible_bits(above, row, below, mask):
+    """Bitmask of rolls in row with fewer than 4 neighbouring rolls"""
+    b0, b1, b2, b3 = neighbour_counter(above, row, below, mask)
+    # count >= 4 exactly when bit 2 or bit 3 is set
+    return row & ~(b2 | b3)
+
+def count_accessible_streaming(lines):
+    """
+    Count accessible rolls reading one line at a time.
+    Only a three-row window is kept, so memory is bounded by the row width.
+    """
+    above = row = None
+    mask = 0
+    accessible_count = 0
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        mask = (1 << len(line)) - 1
+        below = int(line.translate(TO_BITS), 2)
+        if row is not None:
+            accessible_count += accessible_bits(above or 0, row, below, mask).bit_count()
+        above, row = row, below
+
+    if row is not None:
+        accessible_count += accessible_bits(above or 0, row, 0, mask).bit_count()
+
+    return accessible_count
+
+class RollBitGrid:
+    """
+    Roll grid stored as row bitsets. Neighbour counts for a whole row are
+    built with shifts and a bit-sliced adder, so each row costs a few
+    big-int operations (O(width / 64) machine words) instead of a Python
+    loop over its cells.
+    """
+    def __init__(self, rows, width):
+        self.rows = rows
+        self.width = width
+        self.mask = (1 << width) - 1
+
+    @classmethod
+    def from_lines(cls, lines):
+        rows = []
+        width = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            width = max(width, len(line))
+            rows.append(int(line.translate(TO_BITS), 2))
+        return cls(rows, width)
+
+    @classmethod
+    def from_file(cls, filename):
+        with open(filename, 'r') as f:
+            return cls.from_lines(f)
+
+    def neighbour_counter(self, i):
+        """Bit-sliced neighbour counts (b0, b1, b2, b3) for every cell of row i"""
+        rows = self.rows
+        above = rows[i - 1] if i > 0 else 0
+        below = rows[i + 1] if i + 1 < len(rows) else 0
+        return neighbour_counter(above, rows[i], below, self.mask)
+
+    def accessible_row(self, i):
+        """Bitmask of rolls in row i with fewer than 4 neighbouring rolls"""
+        rows = self.rows
+        above = rows[i - 1] if i > 0 else 0
+        below = rows[i + 1] if i + 1 < len(rows) else 0
+        return accessible_bits(above, rows[i], below, self.mask)
+
+    def count_accessible(self):
+        return sum(self.accessible_row(i).bit_count() for i in range(len(self.rows)))
+
+    def remove_iteratively(self):
+        """
+        Peel accessible rolls round by round, yielding the size of each round.
+        Only rows next to a row that changed are re-examined.
+        """
+        dirty = set(range(len(self.rows)))
+
+        while dirty:
+            removals = []
+            for i in sorted(dirty):
+                accessible = self.accessible_row(i)
+                if accessible:
+                    removals.append((i, accessible))
+
+            if not removals:
+                break
+
+            # Remove the whole round at once, as the rules require
+            dirty = set()
+            for i, accessible in removals:
+                self.rows[i] &= ~accessible
+                dirty.update(r for r in (i - 1, i, i + 1) if 0 <= r < len(self.rows))
+
+            yield sum(accessible.bit_count() for _, accessible in removals)
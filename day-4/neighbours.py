@@ -0,0 +1,128 @@
+"""
+Advent of Code 2025 - Day 4
+Whole-grid neighbour counting with a padded 3x3 box sum
+"""
+
+from array import array
+from operator import add, sub
+
+def roll_cells(grid):
+    """Convert grid rows to lists of 1 (roll) / 0 (empty)"""
+    return [[1 if c == '@' else 0 for c in row] for row in grid]
+
+def neighbour_counts(cells):
+    """
+    Count the rolls around every cell at once.
+    Sum each padded row with its shifted copies, then sum three of those
+    rows, then subtract the cell itself - no per-cell bounds checks.
+    """
+    cols = len(cells[0])
+    empty = [0] * (cols + 2)
+    padded = [empty] + [[0] + row + [0] for row in cells] + [empty]
+
+    # Horizontal 1x3 sums
+    horizontal = [list(map(add, map(add, row[:-2], row[1:-1]), row[2:])) for row in padded]
+
+    counts = []
+    for i, row in enumerate(cells):
+        box = map(add, map(add, horizontal[i], horizontal[i + 1]), horizontal[i + 2])
+        counts.append(list(map(sub, box, row)))
+    return counts
+
+def accessible_mask(cells, counts, threshold=4):
+    """True for rolls with fewer than threshold neighbouring rolls"""
+    return [
+        [cell == 1 and count < threshold for cell, count in zip(cell_row, count_row)]
+        for cell_row, count_row in zip(cells, counts)
+    ]
+
+def peel_decomposition(grid, threshold=4):
+    """
+    Decompose the rolls for every "fewer than t neighbours" rule at once.
+
+    Returns (removal_thresholds, rounds), both flat row-major per-cell arrays:
+      removal_thresholds[i * cols + j] is the smallest t (1-9) whose peel
+        removes that roll, i.e. its core number + 1; 0 means no roll.
+        The peel for rule t removes exactly the rolls with value <= t.
+      rounds[i * cols + j] is the round in which the roll falls when peeling
+        with the given threshold; 0 means no roll or never removed.
+    """
+    rows = len(grid)
+    cols = len(grid[0])
+    cells = roll_cells(grid)
+    counts = neighbour_counts(cells)
+
+    # Flat indices on a grid padded by one empty cell, so neighbours need no bounds checks
+    width = cols + 2
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+    is_roll = bytearray(width * (rows + 2))
+    degree = [0] * len(is_roll)
+    for i in range(rows):
+        base = (i + 1) * width + 1
+        is_roll[base:base + cols] = bytes(cells[i])
+        degree[base:base + cols] = counts[i]
+    rolls = [p for p in range(len(is_roll)) if is_roll[p]]
+
+    # Bucket-queue core decomposition: always remove a roll of least remaining degree
+    core = [0] * len(is_roll)
+    removed = bytearray(len(is_roll))
+    remaining = degree[:]
+    buckets = [[] for _ in range(9)]
+    for p in rolls:
+        buckets[remaining[p]].append(p)
+
+    for level in range(9):
+        bucket = buckets[level]
+        while bucket:
+            p = bucket.pop()
+            if removed[p] or remaining[p] != level:
+                continue  # stale entry, the roll moved to a lower bucket
+            removed[p] = 1
+            core[p] = level
+            for offset in offsets:
+                q = p + offset
+                if is_roll[q] and not removed[q] and remaining[q] > level:
+                    remaining[q] -= 1
+                    buckets[remaining[q]].append(q)
+
+    # Round-by-round peel for the chosen threshold, decrementing neighbours only
+    round_of = [0] * len(is_roll)
+    remaining = degree[:]
+    current = [p for p in rolls if remaining[p] < threshold]
+    round_number = 0
+    while current:
+        round_number += 1
+        for p in current:
+            round_of[p] = round_number
+        next_round = []
+        for p in current:
+            for offset in offsets:
+                q = p + offset
+                if is_roll[q] and not round_of[q]:
+                    remaining[q] -= 1
+                    if remaining[q] == threshold - 1:
+                        next_round.append(q)
+        current = next_round
+
+    removal_thresholds = bytearray(rows * cols)
+    rounds = array('I', bytes(4 * rows * cols))
+    for p in rolls:
+        i, j = divmod(p, width)
+        flat = (i - 1) * cols + (j - 1)
+        removal_thresholds[flat] = core[p] + 1
+        rounds[flat] = round_of[p]
+
+    return removal_thresholds, rounds
+
+def removed_per_threshold(removal_thresholds):
+    """Rolls removed by the full peel for every rule "fewer than t neighbours", t = 1..8"""
+    per_value = [0] * 10
+    for value in removal_thresholds:
+        per_value[value] += 1
+
+    removed = {}
+    total = 0
+    for t in range(1, 9):
+        total += per_value[t]
+        removed[t] = total
+    return removed
@@ -2,10 +2,17 @@
 Advent of Code 2025 - Day 4
 """
 
-def count_adjacent_rolls(grid, i, j):
+from bitgrid import RollBitGrid
+from neighbours import accessible_mask, neighbour_counts, roll_cells
+
+def remove_rolls_iteratively(grid_input):
     """
-    Count rolls of paper adjacent to position (i, j)
+    Keep removing accessible rolls until none are left.
+    Neighbour counts are computed once; removing a roll only decrements its
+    neighbours, and only those that drop below 4 join the next round.
     """
+    # 1. Convert to mutable list of lists
+    grid = [list(row) for row in grid_input]
     rows = len(grid)
     cols = len(grid[0])
     
@@ -15,54 +22,45 @@ def count_adjacent_rolls(grid, i, j):
         (1, -1),  (1, 0),  (1, 1)
     ]
     
-    adjacent_count = 0
-    for di, dj in directions:
-        ni, nj = i + di, j + dj
-        if 0 <= ni < rows and 0 <= nj < cols:
-            if grid[ni][nj] == '@':
-                adjacent_count += 1
-    
-    return adjacent_count
-
-def find_accessible_rolls(grid):
-    """
-    Find all currently accessible rolls (< 4 adjacent rolls)
-    """
-    rows = len(grid)
-    cols = len(grid[0])
-    accessible = []
-    
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i][j] == '@':
-                if count_adjacent_rolls(grid, i, j) < 4:
-                    accessible.append((i, j))
-    
-    return accessible
-
-def remove_rolls_iteratively(grid_input):
-    """
-    Keep removing accessible rolls until none are left
-    """
-    # 1. Convert to mutable list of lists
-    grid = [list(row) for row in grid_input]
-    
+    # 2. Count neighbours once for the whole grid
+    cells = roll_cells(grid)
+    counts = neighbour_counts(cells)
+    mask = accessible_mask(cells, counts)
+    accessible = [(i, j) for i in range(rows) for j in range(cols) if mask[i][j]]
     total_removed = 0
     
-    while True:
-        # 2. Find all currently accessible rolls
-        accessible = find_accessible_rolls(grid)
-        
-        if not accessible:
-            # 2.1 No more rolls can be removed
-            break
-        
-        # 2.2 Remove all accessible rolls
+    while accessible:
+        # 2.1 Remove the whole round at once, as the rules require
         for i, j in accessible:
             grid[i][j] = '.'
         
         total_removed += len(accessible)
         print(f"Removed {len(accessible)} rolls (total so far: {total_removed})")
+        
+        # 2.2 Only neighbours of removed rolls can become accessible
+        next_round = []
+        for i, j in accessible:
+            for di, dj in directions:
+                ni, nj = i + di, j + dj
+                if 0 <= ni < rows and 0 <= nj < cols and grid[ni][nj] == '@':
+                    counts[ni][nj] -= 1
+                    # Queue exactly once, when the count first drops to 3
+                    if counts[ni][nj] == 3:
+                        next_round.append((ni, nj))
+        
+        accessible = next_round
+    
+    return total_removed
+
+def remove_rolls_packed(filename):
+    """
+    Same peel on a bit-packed grid, for grids too large for lists of cells
+    """
+    total_removed = 0
+    
+    for removed in RollBitGrid.from_file(filename).remove_iteratively():
+        total_removed += removed
+        print(f"Removed {removed} rolls (total so far: {total_removed})")
     
     return total_removed
 
@@ -71,4 +69,13 @@ with open('solution.csv', 'r') as f:
     grid = [line.strip() for line in f.readlines()]
 
 result = remove_rolls_iteratively(grid)
+
+# For very large grids, peel the bit-packed representation instead
+# result = remove_rolls_packed('solution.csv')
+
+# Totals for every rule "fewer than t adjacent rolls", t = 1..8, in one decomposition
+# from neighbours import peel_decomposition, removed_per_threshold
+# removal_thresholds, rounds = peel_decomposition(grid)
+# print(removed_per_threshold(removal_thresholds))
+
 print(f"\nTotal rolls removed: {result}")
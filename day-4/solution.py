@@ -2,41 +2,35 @@
 Advent of Code 2025 - Day 4
 """
 
+from bitgrid import RollBitGrid, count_accessible_streaming
+from neighbours import accessible_mask, neighbour_counts, roll_cells
+
 def count_accessible_rolls(grid):
-    rows = len(grid)
-    cols = len(grid[0])
-    accessible_count = 0
-    
-    # Directions for 8 adjacent positions (including diagonals)
-    directions = [
-        (-1, -1), (-1, 0), (-1, 1),
-        (0, -1),           (0, 1),
-        (1, -1),  (1, 0),  (1, 1)
-    ]
+    cells = roll_cells(grid)
+    counts = neighbour_counts(cells)
     
-    for i in range(rows):
-        for j in range(cols):
-            # Check if current position has a roll of paper
-            if grid[i][j] == '@':
-                # Count adjacent rolls
-                adjacent_rolls = 0
-                
-                for di, dj in directions:
-                    ni, nj = i + di, j + dj
-                    # Check if position is within bounds
-                    if 0 <= ni < rows and 0 <= nj < cols:
-                        if grid[ni][nj] == '@':
-                            adjacent_rolls += 1
-                
-                # A roll is accessible if it has fewer than 4 adjacent rolls
-                if adjacent_rolls < 4:
-                    accessible_count += 1
-    
-    return accessible_count
+    # A roll is accessible if it has fewer than 4 adjacent rolls
+    return sum(map(sum, accessible_mask(cells, counts)))
+
+def count_accessible_rolls_packed(filename):
+    """Same count on a bit-packed grid, for grids too large for lists of cells"""
+    return RollBitGrid.from_file(filename).count_accessible()
+
+def count_accessible_rolls_streaming(filename):
+    """Same count reading the grid line by line, keeping only three rows"""
+    with open(filename, 'r') as f:
+        return count_accessible_streaming(f)
 
 # Read your puzzle input
 with open('solution.csv', 'r') as f:
     grid = [line.strip() for line in f.readlines()]
 
 result = count_accessible_rolls(grid)
+
+# For very large grids, count on the bit-packed representation instead
+# result = count_accessible_rolls_packed('solution.csv')
+
+# For grids that do not fit in memory, stream them three rows at a time
+# result = count_accessible_rolls_streaming('solution.csv')
+
 print(f"Number of accessible rolls: {result}")
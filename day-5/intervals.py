@@ -0,0 +1,188 @@
+"""
+Advent of Code 2025 - Day 5
+Merged interval index for fresh ingredient ranges
+"""
+
+from bisect import bisect_right
+from collections import Counter
+from itertools import repeat
+from operator import le
+
+def merge_ranges(ranges):
+    """Merge overlapping ranges to avoid counting duplicates"""
+    if not ranges:
+        return []
+    
+    # Sort ranges by start position
+    sorted_ranges = sorted(ranges)
+    
+    merged = [sorted_ranges[0]]
+    
+    for current_start, current_end in sorted_ranges[1:]:
+        last_start, last_end = merged[-1]
+        
+        # Check if current range overlaps or is adjacent to last range
+        if current_start <= last_end + 1:
+            # Merge by extending the last range
+            merged[-1] = (last_start, max(last_end, current_end))
+        else:
+            # No overlap, add as new range
+            merged.append((current_start, current_end))
+    
+    return merged
+
+class IntervalIndex:
+    """Sorted, disjoint ranges answering membership with one binary search"""
+    def __init__(self, ranges):
+        merged = merge_ranges(ranges)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+        # ends shifted by one so bisect_right's result indexes it directly
+        self._end_at = [float('-inf')] + self.ends
+    
+    def contains(self, ingredient_id):
+        # Last range starting at or before the ID is the only candidate
+        i = bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+    
+    def contains_many(self, ingredient_ids):
+        """Membership mask for a batch of IDs, with the loop kept inside map()"""
+        ingredient_ids = list(ingredient_ids)
+        positions = map(bisect_right, repeat(self.starts), ingredient_ids)
+        return list(map(le, ingredient_ids, map(self._end_at.__getitem__, positions)))
+    
+    def count_contained(self, ingredient_ids):
+        """Bulk path: sort the IDs and sweep them against the ranges once"""
+        count = 0
+        i = 0
+        num_ranges = len(self.starts)
+        
+        for ingredient_id in sorted(ingredient_ids):
+            # Skip ranges that end before this ID
+            while i < num_ranges and self.ends[i] < ingredient_id:
+                i += 1
+            if i == num_ranges:
+                break
+            if self.starts[i] <= ingredient_id:
+                count += 1
+        
+        return count
+
+class IntervalSet:
+    """
+    Long-lived set of fresh ranges with O(log U) updates and queries.
+    A dynamic segment tree over IDs [0, 2**bits): each node counts the
+    inserted ranges covering it whole and how many of its IDs are covered,
+    so overlapping ranges can be added and later removed independently.
+    """
+    def __init__(self, ranges=(), bits=64):
+        self.size = 1 << bits
+        # Node 0 is the root; child index 0 therefore means "no child yet"
+        self._left = [0]
+        self._right = [0]
+        self._count = [0]
+        self._covered = [0]
+        # Inserted ranges with multiplicity, so only known ranges can be removed
+        self._inserted = Counter()
+        for start, end in ranges:
+            self.insert(start, end)
+    
+    def _new_node(self):
+        self._left.append(0)
+        self._right.append(0)
+        self._count.append(0)
+        self._covered.append(0)
+        return len(self._count) - 1
+    
+    def _update(self, node, lo, hi, start, stop, delta):
+        # node covers [lo, hi), the update covers [start, stop)
+        if start <= lo and hi <= stop:
+            self._count[node] += delta
+        else:
+            mid = (lo + hi) // 2
+            if start < mid:
+                if not self._left[node]:
+                    self._left[node] = self._new_node()
+                self._update(self._left[node], lo, mid, start, stop, delta)
+            if stop > mid:
+                if not self._right[node]:
+                    self._right[node] = self._new_node()
+                self._update(self._right[node], mid, hi, start, stop, delta)
+        
+        if self._count[node] > 0:
+            self._covered[node] = hi - lo
+        else:
+            self._covered[node] = (self._covered[self._left[node]] if self._left[node] else 0) + \
+                (self._covered[self._right[node]] if self._right[node] else 0)
+    
+    def insert(self, start, end):
+        """Add the inclusive range start-end"""
+        self._inserted[start, end] += 1
+        self._update(0, 0, self.size, start, end + 1, 1)
+    
+    def remove(self, start, end):
+        """Expire a range previously added with insert(start, end)"""
+        if not self._inserted[start, end]:
+            raise KeyError(f"Range {start}-{end} was never inserted")
+        self._inserted[start, end] -= 1
+        if not self._inserted[start, end]:
+            del self._inserted[start, end]
+        self._update(0, 0, self.size, start, end + 1, -1)
+    
+    def contains(self, ingredient_id):
+        node, lo, hi = 0, 0, self.size
+        while True:
+            if self._count[node] > 0:
+                return True
+            mid = (lo + hi) // 2
+            if ingredient_id < mid:
+                node, hi = self._left[node], mid
+            else:
+                node, lo = self._right[node], mid
+            if not node:
+                return False
+    
+    def covered_total(self):
+        """Number of distinct IDs covered by at least one range"""
+        return self._covered[0]
+    
+    def _covered_in(self, node, lo, hi, start, stop):
+        if stop <= lo or hi <= start:
+            return 0
+        if self._count[node] > 0:
+            return min(hi, stop) - max(lo, start)
+        if start <= lo and hi <= stop:
+            return self._covered[node]
+        mid = (lo + hi) // 2
+        total = 0
+        if self._left[node]:
+            total += self._covered_in(self._left[node], lo, mid, start, stop)
+        if self._right[node]:
+            total += self._covered_in(self._right[node], mid, hi, start, stop)
+        return total
+    
+    def covered_between(self, start, end):
+        """Number of covered IDs inside the inclusive range start-end"""
+        return self._covered_in(0, 0, self.size, start, end + 1)
+    
+    def ranges(self):
+        """Current coverage as sorted, merged inclusive ranges"""
+        merged = []
+        stack = [(0, 0, self.size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if not self._covered[node]:
+                continue
+            if self._count[node] > 0:
+                if merged and merged[-1][1] == lo - 1:
+                    merged[-1] = (merged[-1][0], hi - 1)
+                else:
+                    merged.append((lo, hi - 1))
+                continue
+            mid = (lo + hi) // 2
+            # Push right first so the left half is visited first
+            if self._right[node]:
+                stack.append((self._right[node], mid, hi))
+            if self._left[node]:
+                stack.append((self._left[node], lo, mid))
+        return merged
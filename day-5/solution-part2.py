@@ -2,6 +2,8 @@
 Advent of Code 2025 - Day 5
 """
 
+from intervals import merge_ranges
+
 def parse_ranges(filename):
     """
     Parse ranges and ingredient IDs
@@ -20,29 +22,6 @@ def parse_ranges(filename):
     
     return ranges
 
-def merge_ranges(ranges):
-    """Merge overlapping ranges to avoid counting duplicates"""
-    if not ranges:
-        return []
-    
-    # Sort ranges by start position
-    sorted_ranges = sorted(ranges)
-    
-    merged = [sorted_ranges[0]]
-    
-    for current_start, current_end in sorted_ranges[1:]:
-        last_start, last_end = merged[-1]
-        
-        # Check if current range overlaps or is adjacent to last range
-        if current_start <= last_end + 1:
-            # Merge by extending the last range
-            merged[-1] = (last_start, max(last_end, current_end))
-        else:
-            # No overlap, add as new range
-            merged.append((current_start, current_end))
-    
-    return merged
-
 def count_fresh_ids(filename):
     """
     Count all ingredient IDs considered fresh by all ranges
@@ -61,6 +40,23 @@ def count_fresh_ids(filename):
     
     return total_count
 
+def count_fresh_ids_live(fresh_set, verbose=True):
+    """
+    Same count served from a long-lived IntervalSet that ranges are
+    inserted into and removed from, without re-sorting
+    """
+    if verbose:
+        for start, end in fresh_set.ranges():
+            print(f"Range {start}-{end}: {end - start + 1} IDs")
+    
+    return fresh_set.covered_total()
+
 # Run solution
 result = count_fresh_ids('solution.csv')
+
+# Keep the ranges in a live set when they change between queries
+# from intervals import IntervalSet
+# fresh_set = IntervalSet(parse_ranges('solution.csv'))
+# result = count_fresh_ids_live(fresh_set)
+
 print(f"\nTotal fresh ingredient IDs: {result}")
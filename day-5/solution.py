@@ -2,6 +2,11 @@
 Advent of Code 2025 - Day 5
 """
 
+import mmap
+import re
+
+from intervals import IntervalIndex
+
 def parse_input(filename):
     """
     Parse ranges and ingredient IDs
@@ -25,29 +30,70 @@ def parse_input(filename):
     
     return ranges, ingredient_ids
 
-def is_fresh(ingredient_id, ranges):
+def is_fresh(ingredient_id, index):
     """
-    Check if ingredient ID falls within any fresh range
+    Check if ingredient ID falls within any fresh range of an
+    IntervalIndex (or a live IntervalSet)
     """
-    for start, end in ranges:
-        if start <= ingredient_id <= end:
-            return True
-    return False
+    return index.contains(ingredient_id)
 
-def count_fresh_ingredients(filename):
+def count_fresh_ingredients(filename, verbose=True):
     """Count how many available ingredients are fresh"""
     ranges, ingredient_ids = parse_input(filename)
     
+    # Merge and sort the ranges once, then binary search per ID
+    index = IntervalIndex(ranges)
+    
     fresh_count = 0
     for ingredient_id in ingredient_ids:
-        if is_fresh(ingredient_id, ranges):
+        if is_fresh(ingredient_id, index):
             fresh_count += 1
-            print(f"Ingredient ID {ingredient_id} is fresh")
-        else:
+            if verbose:
+                print(f"Ingredient ID {ingredient_id} is fresh")
+        elif verbose:
             print(f"Ingredient ID {ingredient_id} is spoiled")
     
     return fresh_count
 
+def count_fresh_ingredients_bulk(filename):
+    """Count fresh ingredients by sorting the IDs and sweeping the ranges"""
+    ranges, ingredient_ids = parse_input(filename)
+    return IntervalIndex(ranges).count_contained(ingredient_ids)
+
+def count_fresh_ingredients_streaming(filename, chunk_size=1 << 24):
+    """
+    Count fresh ingredients without loading the ID list.
+    The file is memory-mapped and the ID section parsed chunk_size bytes
+    at a time, each chunk checked as a batch against the merged ranges.
+    """
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Split by blank line, accepting LF or CRLF line endings
+        separator = re.search(rb'\r?\n\r?\n', mm)
+        if separator is None:
+            raise ValueError(f"{filename}: no blank line between ranges and ingredient IDs")
+        ranges = []
+        for line in mm[:separator.start()].split():
+            start, end = map(int, line.split(b'-'))
+            ranges.append((start, end))
+        index = IntervalIndex(ranges)
+        
+        fresh_count = 0
+        pos = separator.end()
+        size = len(mm)
+        while pos < size:
+            # Extend each chunk to the end of its last line
+            end = mm.find(b'\n', min(pos + chunk_size, size))
+            end = size if end == -1 else end + 1
+            ingredient_ids = list(map(int, mm[pos:end].split()))
+            fresh_count += sum(index.contains_many(ingredient_ids))
+            pos = end
+    
+    return fresh_count
+
 # Run solution
 result = count_fresh_ingredients('solution.csv')
+
+# For multi-gigabyte ID lists, stream the file without per-ID output
+# result = count_fresh_ingredients_streaming('solution.csv')
+
 print(f"\nTotal fresh ingredients: {result}")
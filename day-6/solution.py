@@ -2,60 +2,36 @@
 Advent of Code 2025 - Day 6
 """
 
-def solve_worksheet_simple(filename):
+from worksheet import evaluate, evaluate_all, parse_row_problems, row_problem, stream_problem_blocks
+
+def solve_worksheet_simple(filename, workers=1):
     """
     Simplified solution assuming clear column separation
     """
-    with open(filename, 'r') as f:
-        lines = [line.rstrip('\n') for line in f.readlines()]
-    
-    # Pad lines to same width
-    max_width = max(len(line) for line in lines)
-    lines = [line.ljust(max_width) for line in lines]
-    
-    # Split by empty columns
-    problems = []
-    current_problem = []
-    
-    for col_idx in range(max_width):
-        column = [line[col_idx] for line in lines]
-        
-        # Check if column is empty
-        if all(c == ' ' for c in column):
-            if current_problem:
-                problems.append(current_problem)
-                current_problem = []
-        else:
-            current_problem.append(column)
-    
-    # Handle last problem
-    if current_problem:
-        problems.append(current_problem)
+    # Parse once on a padded byte buffer; separators come from one reduction
+    problems = parse_row_problems(filename)
     
     # Process each problem
     grand_total = 0
     
-    for prob_idx, problem in enumerate(problems, 1):
-        # Combine columns and extract data
-        rows = [''.join(col).strip() for col in zip(*problem)]
-        rows = [r for r in rows if r]
-        
-        operation = rows[-1]
-        numbers = [int(r) for r in rows[:-1]]
-        
-        # Calculate
-        result = numbers[0]
-        for num in numbers[1:]:
-            if operation == '+':
-                result += num
-            elif operation == '*':
-                result *= num
-        
+    # Calculate, in parallel when workers > 1
+    results = evaluate_all(problems, workers)
+    
+    for prob_idx, ((numbers, operation), result) in enumerate(zip(problems, results), 1):
         print(f"Problem {prob_idx}: {numbers} {operation} = {result}")
         grand_total += result
     
     return grand_total
 
-# Run solution
-result = solve_worksheet_simple('solution.csv')
-print(f"\nGrand Total: {result}")
+def solve_worksheet_streaming(filename):
+    """Grand total for very wide worksheets, evaluating problems as they stream in"""
+    return sum(evaluate(*row_problem(block)) for block in stream_problem_blocks(filename))
+
+if __name__ == "__main__":
+    # Run solution
+    result = solve_worksheet_simple('solution.csv')
+    
+    # For very wide worksheets, stream the columns instead
+    # result = solve_worksheet_streaming('solution.csv')
+    
+    print(f"\nGrand Total: {result}")
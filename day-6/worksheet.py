@@ -0,0 +1,169 @@
+"""
+Advent of Code 2025 - Day 6
+Worksheet parsing on one padded byte buffer
+"""
+
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Every byte becomes 1 except space, which becomes 0
+OCCUPIED = bytes(0 if i == ord(' ') else 1 for i in range(256))
+
+def load_worksheet(filename):
+    """
+    Read the worksheet into one row-major buffer of padded rows.
+    Returns (buf, width, num_rows); column c is buf[c::width].
+    """
+    with open(filename, 'rb') as f:
+        lines = [line.rstrip(b'\r\n') for line in f]
+
+    width = max(len(line) for line in lines)
+    buf = b''.join(line.ljust(width) for line in lines)
+    return buf, width, len(lines)
+
+def problem_spans(buf, width, num_rows):
+    """
+    Column ranges [start, stop) of each problem, left to right.
+    OR-ing every row's occupancy mask leaves 0 only in all-space columns.
+    """
+    occupied = 0
+    for row in range(num_rows):
+        line = buf[row * width:(row + 1) * width]
+        occupied |= int.from_bytes(line.translate(OCCUPIED), 'big')
+
+    mask = occupied.to_bytes(width, 'big')
+    return [match.span() for match in re.finditer(rb'[^\x00]+', mask)]
+
+def row_problem(rows):
+    """Problem read row by row: one number per row, operator on the last row"""
+    rows = [r.strip() for r in rows]
+    rows = [r for r in rows if r]
+    return [int(r) for r in rows[:-1]], rows[-1].decode()
+
+def column_problem(rows):
+    """
+    Problem read right to left, one number per column (top to bottom),
+    operator somewhere on the last row. Returns None for an empty problem.
+    """
+    width = len(rows[0])
+    buf = b''.join(rows[:-1])
+    numbers = []
+    for col in range(width - 1, -1, -1):
+        # Strided slice: the whole column without the operator row
+        digits = buf[col::width].replace(b' ', b'')
+        if digits:
+            numbers.append(int(digits))
+
+    operation = rows[-1].strip().decode()
+    if numbers and operation:
+        return numbers, operation
+    return None
+
+def problem_blocks(buf, width, num_rows, spans):
+    for start, stop in spans:
+        yield [buf[row * width + start:row * width + stop] for row in range(num_rows)]
+
+def parse_row_problems(filename):
+    """Problems in left-to-right order, read row by row"""
+    buf, width, num_rows = load_worksheet(filename)
+    spans = problem_spans(buf, width, num_rows)
+    return [row_problem(block) for block in problem_blocks(buf, width, num_rows, spans)]
+
+def parse_column_problems(filename):
+    """Problems in right-to-left order, read column by column"""
+    buf, width, num_rows = load_worksheet(filename)
+    spans = reversed(problem_spans(buf, width, num_rows))
+    problems = (column_problem(block) for block in problem_blocks(buf, width, num_rows, spans))
+    return [problem for problem in problems if problem]
+
+def stream_problem_blocks(filename, chunk_size=1 << 20):
+    """
+    Yield each problem, left to right, as a list of its padded row slices.
+    The file is memory-mapped and walked chunk_size columns at a time across
+    all rows, so memory depends on the row count and the widest problem,
+    not on the worksheet width. A problem is yielded as soon as the
+    separator column after it is reached.
+    """
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Row offsets; a final newline does not start another row
+        rows = []
+        pos = 0
+        while pos < len(mm):
+            end = mm.find(b'\n', pos)
+            if end == -1:
+                end = len(mm)
+            next_pos = end + 1
+            # Leave out CRLF carriage returns, as load_worksheet does
+            while end > pos and mm[end - 1] == ord('\r'):
+                end -= 1
+            rows.append((pos, end))
+            pos = next_pos
+
+        width = max(end - start for start, end in rows)
+        pending = None
+
+        for chunk_start in range(0, width, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, width)
+            n = chunk_stop - chunk_start
+            pieces = [
+                mm[min(start + chunk_start, end):min(start + chunk_stop, end)].ljust(n)
+                for start, end in rows
+            ]
+
+            occupied = 0
+            for piece in pieces:
+                occupied |= int.from_bytes(piece.translate(OCCUPIED), 'big')
+            mask = occupied.to_bytes(n, 'big')
+
+            for match in re.finditer(rb'[^\x00]+', mask):
+                start, stop = match.span()
+                block = [piece[start:stop] for piece in pieces]
+                if pending is not None and start == 0:
+                    # Continues the problem cut by the previous chunk boundary
+                    pending = [left + right for left, right in zip(pending, block)]
+                else:
+                    if pending is not None:
+                        yield pending
+                    pending = block
+                if stop < n:
+                    yield pending
+                    pending = None
+
+            if not mask.strip(b'\x00') and pending is not None:
+                yield pending
+                pending = None
+
+        if pending is not None:
+            yield pending
+
+def product_tree(numbers):
+    """
+    Multiply pairwise in a balanced tree so operands stay similar in size;
+    left-to-right multiplication is quadratic in the size of the result.
+    """
+    numbers = list(numbers)
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+def evaluate(numbers, operation):
+    if operation == '*':
+        return product_tree(numbers)
+    elif operation == '+':
+        return sum(numbers)
+    return numbers[0]
+
+def evaluate_all(problems, workers=1):
+    """Results of every (numbers, operation) problem, across a process pool if workers > 1"""
+    if workers == 1:
+        return [evaluate(numbers, operation) for numbers, operation in problems]
+
+    problems = list(problems)
+    chunksize = max(1, len(problems) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(evaluate, *zip(*problems), chunksize=chunksize))
@@ -62,6 +62,92 @@ def solve_quantum_tachyon_manifold(filename):
     # Total timelines is sum of all active timelines
     return sum(current)
 
+def splitter_columns(line):
+    """Columns of the splitters in line, left to right"""
+    columns = []
+    col = line.find('^')
+    while col != -1:
+        columns.append(col)
+        col = line.find('^', col + 1)
+    return columns
+
+def splitter_index(grid):
+    """Splitter columns of every row below the start row that has any, top to bottom"""
+    splitter_rows = []
+    for row in range(1, len(grid)):
+        columns = splitter_columns(grid[row])
+        if columns:
+            splitter_rows.append(columns)
+    return splitter_rows
+
+def solve_quantum_tachyon_manifold_sparse(filename):
+    """
+    Count timelines keeping only the columns that carry timelines.
+    Rows without splitters leave every timeline in place, so only rows
+    that have splitters are visited, and each costs O(its splitters).
+    """
+    with open(filename, 'r') as f:
+        grid = [line.rstrip('\n') for line in f.readlines()]
+    
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    
+    # Find starting position (S)
+    start_col = grid[0].find('S') if rows > 0 else -1
+    if start_col == -1:
+        return 0
+    
+    splitter_rows = splitter_index(grid)
+    
+    # current[col] = number of timelines at this column, non-zero entries only
+    current = {start_col: 1}
+    
+    for columns in splitter_rows:
+        # Take every hit first, so timelines split in this row are not split twice
+        hits = [(col, current.pop(col)) for col in columns if col in current]
+        
+        for col, num_timelines in hits:
+            if col - 1 >= 0:
+                current[col - 1] = current.get(col - 1, 0) + num_timelines
+            if col + 1 < cols:
+                current[col + 1] = current.get(col + 1, 0) + num_timelines
+    
+    # Total timelines is sum of all active timelines
+    return sum(current.values())
+
+def timelines_per_start_column(filename):
+    """
+    Timelines for a beam entering at every top column, in one pass.
+    Reverse DP from the bottom: timelines[col] is the number of timelines a
+    beam at col produces from the current row down. Below the last row it is
+    1 everywhere; a splitter at col replaces it with the sum of its
+    neighbours' values from the row below. Rows without splitters change
+    nothing, so only splitter rows are visited.
+    """
+    with open(filename, 'r') as f:
+        grid = [line.rstrip('\n') for line in f.readlines()]
+    
+    cols = len(grid[0]) if grid else 0
+    timelines = [1] * cols
+    
+    for columns in reversed(splitter_index(grid)):
+        # Read the row below for every splitter before writing any of them
+        updated = [
+            (timelines[col - 1] if col - 1 >= 0 else 0) + (timelines[col + 1] if col + 1 < cols else 0)
+            for col in columns
+        ]
+        for col, value in zip(columns, updated):
+            timelines[col] = value
+    
+    return timelines
+
 # Solve puzzle
 result = solve_quantum_tachyon_manifold('solution.csv')
+
+# Sparse DP, for tall or wide manifolds with few splitters
+# result = solve_quantum_tachyon_manifold_sparse('solution.csv')
+
+# Timelines for an emitter placed at every top column
+# print(timelines_per_start_column('solution.csv'))
+
 print(f"Total number of timelines: {result}")
@@ -2,6 +2,15 @@
 Advent of Code 2025 - Day 7
 """
 
+# Every byte becomes '0' except '^', which becomes '1'
+SPLITTER_BITS = bytes(ord('1') if i == ord('^') else ord('0') for i in range(256))
+
+def splitter_mask(line):
+    """Bitmask of splitter columns in line, bit c for column c"""
+    if not line:
+        return 0
+    return int(line.encode().translate(SPLITTER_BITS)[::-1], 2)
+
 def solve_tachyon_manifold(filename):
     """
     Simulate tachyon beam splitting through the manifold
@@ -14,52 +23,27 @@ def solve_tachyon_manifold(filename):
     cols = len(grid[0]) if rows > 0 else 0
     
     # Find starting position of beam (marked 'S')
-    start_col = None
-    for col in range(cols):
-        if grid[0][col] == 'S':
-            start_col = col
-            break
-    
-    if start_col is None:
+    start_col = grid[0].find('S') if rows > 0 else -1
+    if start_col == -1:
         return 0
     
-    # Track active beams, all beams move downward
-    beams = [(1, start_col)]
-
-    # Track which positions have already been processed
-    # Mark S as visited
-    visited = set()
-    visited.add((0, start_col))
+    # Splitter columns per row, precomputed as bitmasks
+    splitters = [splitter_mask(line) for line in grid]
     
+    # Active beam columns for the current row as one bitmask;
+    # beams merging into the same cell are naturally counted once
+    width_mask = (1 << cols) - 1
+    active = 1 << start_col
     split_count = 0
     
-    while beams:
-        new_beams = []
-        
-        for row, col in beams:
-            # Check if out of bounds
-            if row < 0 or row >= rows or col < 0 or col >= cols:
-                continue
-            
-            # Check if position has been processed
-            if (row, col) in visited:
-                continue
-            visited.add((row, col))
-            
-            cell = grid[row][col]
-            
-            # If hits a splitter
-            if cell == '^':
-                split_count += 1
-                # Create two new beams from left and right of splitter
-                # Both move downward from next row
-                new_beams.append((row + 1, col - 1))
-                new_beams.append((row + 1, col + 1))
-            else:
-                # Continue downward
-                new_beams.append((row + 1, col))
+    for row in range(1, rows):
+        if not active:
+            break
         
-        beams = new_beams
+        # Beams hitting a splitter go left and right, the rest continue down
+        hits = active & splitters[row]
+        split_count += hits.bit_count()
+        active = (active & ~hits) | (hits >> 1) | ((hits << 1) & width_mask)
     
     return split_count
 